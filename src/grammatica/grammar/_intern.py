@@ -0,0 +1,38 @@
+"""
+Utilities for sharing and reusing grammars that are structurally equal.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from grammatica.grammar.base import Grammar
+
+G = TypeVar("G", bound="Grammar")
+
+_interned: WeakValueDictionary[int, Grammar] = WeakValueDictionary()
+"""Interned grammars that are still in use, keyed by structural hash."""
+
+
+def intern_grammar(grammar: G) -> G:
+    """Return a previously interned grammar equal to the one provided, or intern it.
+
+    Interning lets equal grammars share a single instance, so comparing them is an identity check.
+
+    Args:
+        grammar (G): Grammar to intern.
+
+    Returns:
+        G: Interned grammar.
+    """
+    key = grammar.structural_hash
+    interned = _interned.get(key)
+    if interned is None:
+        _interned[key] = grammar
+        return grammar
+    if (type(interned) is type(grammar)) and interned.equals(grammar):
+        return interned
+    # Keep the existing entry on a hash collision
+    return grammar
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing import (
         Any,
+        Callable,
         Collection,
         Mapping,
     )
@@ -20,7 +21,13 @@ if TYPE_CHECKING:
 class Grammar(ABC):
     """Base class for grammar expressions."""
 
-    __slots__: tuple[str, ...] = ()
+    __slots__: tuple[str, ...] = ("_structural_hash", "__weakref__")
+
+    is_group: bool = False
+    """Whether the grammar is a grouped grammar."""
+
+    def __init__(self) -> None:
+        self._structural_hash: int | None = None
 
     @abstractmethod
     def render(self, **kwargs) -> str | None:
@@ -41,7 +48,7 @@ class Grammar(ABC):
         Attempts to reduce redundancy and optimize the grammar.
 
         Note:
-            The resulting grammar and its parts are copies, and the original grammar is not modified.
+            The original grammar is not modified, and parts that are already simple may be shared with the result.
 
         Returns:
             Grammar | None: Simplified expression, or None if resolved to empty.
@@ -57,6 +64,34 @@ class Grammar(ABC):
         """
         return {}
 
+    @property
+    def structural_hash(self) -> int:
+        """Hash of the grammar type and attributes, computed bottom-up from subexpressions.
+
+        Note:
+            The hash is computed once and cached, so grammars must not change after construction.
+            Grammars are only hashable when their type defines ``__hash__`` from this value.
+
+        Returns:
+            int: Structural hash of the grammar.
+
+        Raises:
+            ValueError: Attribute type is not supported.
+        """
+        # Subclasses that do not call Grammar.__init__ have no cached value yet
+        cached = getattr(self, "_structural_hash", None)
+        if cached is not None:
+            return cached
+        attrs = self.attrs_dict()
+        structural_hash = hash(
+            (
+                type(self),
+                tuple((k, _value_to_hashable(attrs[k])) for k in sorted(attrs)),
+            )
+        )
+        self._structural_hash = structural_hash
+        return structural_hash
+
     def copy(self) -> Grammar:
         """Create a copy of the grammar.
 
@@ -139,6 +174,20 @@ def value_is_simple(value: Any) -> bool:
     return False
 
 
+def _value_to_hashable(value: Any) -> Any:
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(map(_value_to_hashable, value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(_value_to_hashable, value))
+    if isinstance(value, dict):
+        return frozenset((k, _value_to_hashable(v)) for k, v in value.items())
+    if isinstance(value, Grammar):
+        return value.structural_hash
+    raise ValueError(f"Unsupported value type: {type(value).__name__}")
+
+
 def _collection_to_string(value: Collection[Any], indent: int | None) -> str:
     prefix: str
     suffix: str
@@ -154,56 +203,54 @@ def _collection_to_string(value: Collection[Any], indent: int | None) -> str:
         if not value:
             return "frozenset()"
         prefix, suffix = "frozenset({", "})"
-    msg = prefix
+    parts: list[str] = [prefix]
     if all(map(value_is_simple, value)):
         for j, subvalue in enumerate(value):
             if j > 0:
-                msg += ", "
-            msg += value_to_string(subvalue, indent=None)
+                parts.append(", ")
+            parts.append(value_to_string(subvalue, indent=None))
     else:
         value_n = len(value)
+        pad = "" if indent is None else "\n" + (" " * indent)
         for j, subvalue in enumerate(value):
             if indent is None:
                 if j > 0:
-                    msg += ", "
-                msg += value_to_string(subvalue, indent=indent)
+                    parts.append(", ")
+                parts.append(value_to_string(subvalue, indent=indent))
             else:
                 if j > 0:
-                    msg += ","
-                msg += "\n" + (" " * indent)
-                msg += value_to_string(subvalue, indent=indent).replace(
-                    "\n",
-                    "\n" + (" " * indent),
+                    parts.append(",")
+                parts.append(pad)
+                parts.append(
+                    value_to_string(subvalue, indent=indent).replace("\n", pad)
                 )
                 if j == value_n - 1:
-                    msg += "\n"
-    msg += suffix
-    return msg
+                    parts.append("\n")
+    parts.append(suffix)
+    return "".join(parts)
 
 
 def _mapping_to_string(value: Mapping[Any, Any], indent: int | None) -> str:
-    msg = "{"
-    for j, k in enumerate(tuple(value)):
-        subkey, subvalue = k, value[k]
+    parts: list[str] = ["{"]
+    last = len(value) - 1
+    pad = "" if indent is None else "\n" + (" " * indent)
+    for j, (subkey, subvalue) in enumerate(value.items()):
         if indent is None:
             if j > 0:
-                msg += ", "
+                parts.append(", ")
         else:
             if j > 0:
-                msg += ","
-            msg += "\n" + (" " * indent)
-        msg += value_to_string(subkey, indent=indent) + ": "
+                parts.append(",")
+            parts.append(pad)
+        parts.append(value_to_string(subkey, indent=indent) + ": ")
         if indent is None:
-            msg += value_to_string(subvalue, indent=indent)
+            parts.append(value_to_string(subvalue, indent=indent))
         else:
-            msg += value_to_string(subvalue, indent=indent).replace(
-                "\n",
-                "\n" + (" " * indent),
-            )
-            if j == len(value) - 1:
-                msg += "\n"
-    msg += "}"
-    return msg
+            parts.append(value_to_string(subvalue, indent=indent).replace("\n", pad))
+            if j == last:
+                parts.append("\n")
+    parts.append("}")
+    return "".join(parts)
 
 
 def value_to_string(value: Any, indent: int | None) -> str:
@@ -219,6 +266,10 @@ def value_to_string(value: Any, indent: int | None) -> str:
     Raises:
         ValueError: Value type is unsupported.
     """
+    handler = _VALUE_TO_STRING_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value, indent)
+    # Fall back to checking instances, for subclasses of the supported types
     if value is None:
         return "None"
     if isinstance(value, bool):
@@ -234,3 +285,18 @@ def value_to_string(value: Any, indent: int | None) -> str:
     if isinstance(value, Grammar):
         return value.as_string(indent=indent)
     raise ValueError(f"Unsupported value type: {type(value).__name__}")
+
+
+_VALUE_TO_STRING_HANDLERS: dict[type, Callable[[Any, int | None], str]] = {
+    type(None): lambda value, indent: "None",
+    bool: lambda value, indent: "True" if value else "False",
+    int: lambda value, indent: str(value),
+    float: lambda value, indent: str(value),
+    str: lambda value, indent: repr(value),
+    tuple: _collection_to_string,
+    list: _collection_to_string,
+    set: _collection_to_string,
+    frozenset: _collection_to_string,
+    dict: _mapping_to_string,
+}
+"""String conversion for each exact value type that does not need an instance check."""
@@ -71,7 +71,7 @@ class CharRange(Grammar):
         [^0-9]
     """
 
-    __slots__: tuple[str, ...] = ("char_ranges", "negate")
+    __slots__: tuple[str, ...] = ("_char_ranges", "_negate")
 
     def __init__(
         self,
@@ -94,15 +94,25 @@ class CharRange(Grammar):
         for cstart, cend in unsorted_char_ranges:
             ords.update(range(ord(cstart), ord(cend) + 1))
         ord_ranges = self._iter_ords_to_ord_ranges(ords)
-        self.char_ranges: list[tuple[str, str]] = list(
+        self._char_ranges: tuple[tuple[str, str], ...] = tuple(
             map(self._ord_range_to_char_range, ord_ranges)
         )
-        """Character ranges in the form of tuples (start, end).
-            Each range is inclusive, meaning both start and end characters are included.
-            For example, ('a', 'z') includes all lowercase letters from 'a' to 'z'.
+
+        self._negate: bool = negate
+
+    @property
+    def char_ranges(self) -> tuple[tuple[str, str], ...]:
+        """tuple[tuple[str, str], ...]: Character ranges in the form of tuples (start, end).
+
+        Each range is inclusive, meaning both start and end characters are included.
+        For example, ('a', 'z') includes all lowercase letters from 'a' to 'z'.
         """
-        self.negate: bool = negate
-        """Negate the character range."""
+        return self._char_ranges
+
+    @property
+    def negate(self) -> bool:
+        """bool: Negate the character range."""
+        return self._negate
 
     def render(self, **kwargs) -> str | None:
         """Render the character range grammar as a GBNF string.
@@ -128,21 +138,21 @@ class CharRange(Grammar):
             >>> alphanum.render()
             '[^0-9A-Za-z]'
         """
-        if len(self.char_ranges) == 0:
+        if len(self._char_ranges) == 0:
             return None
         # TODO: Should character ranges be validated before rendering? They're currently only validated upon construction.
         ords: set[int] = set()
-        for cstart, cend in self.char_ranges:
+        for cstart, cend in self._char_ranges:
             ords.update(range(ord(cstart), ord(cend) + 1))
         expr = "["
-        if self.negate:
+        if self._negate:
             expr += "^"
         for start, end in self._iter_ords_to_ord_ranges(ords):
-            start_esc = self._escape(chr(start))
+            start_esc = _RANGE_ESCAPE_TABLE[start]
             if start == end:
                 expr += start_esc
                 continue
-            end_esc = self._escape(chr(end))
+            end_esc = _RANGE_ESCAPE_TABLE[end]
             if end == start + 1:
                 expr += f"{start_esc}{end_esc}"
             else:
@@ -178,21 +188,26 @@ class CharRange(Grammar):
             >>> simplified
             CharRange(char_ranges=[('a', 'z')], negate=False)
 
-            Empty character ranges resolve to :py:class:`None`
+            Empty character ranges are rejected when the grammar is created, and cannot be cleared afterwards
 
             >>> from grammatica.grammar import CharRange
-            >>> empty_range = CharRange([("a", "a")])
-            >>> empty_range.char_ranges.clear()  # Manually clear to simulate empty ranges
-            >>> simplified = empty_range.simplify()
-            >>> simplified is None
-            True
+            >>> empty_range = CharRange([])
+            Traceback (most recent call last):
+                ...
+            ValueError: char_ranges must not be empty
+            >>> char_range = CharRange([("a", "a")])
+            >>> char_range.char_ranges = []
+            Traceback (most recent call last):
+                ...
+            AttributeError: ...
         """
-        n = len(self.char_ranges)
+        char_ranges = self._char_ranges
+        n = len(char_ranges)
         if n == 0:
             return None
-        if (n == 1) and (self.char_ranges[0][0] == self.char_ranges[0][1]):
-            return String(self.char_ranges[0][0])
-        return CharRange(self.char_ranges.copy(), negate=self.negate)
+        if (n == 1) and (char_ranges[0][0] == char_ranges[0][1]):
+            return String.of(char_ranges[0][0])
+        return CharRange(char_ranges, negate=self._negate)
 
     @staticmethod
     def _escape(char: str) -> str:
@@ -204,13 +219,7 @@ class CharRange(Grammar):
         Returns:
             str: Escaped character.
         """
-        if char in RANGE_ESCAPE_CHARS:
-            return "\\" + char
-        if char in ALWAYS_SAFE_CHARS:
-            return char
-        if char in CHAR_ESCAPE_MAP:
-            return CHAR_ESCAPE_MAP[char]
-        return char_to_hex(char)
+        return _escape_range_char(char)
 
     @classmethod
     def from_chars(cls, chars: Iterable[str], negate: bool = False) -> CharRange:
@@ -313,6 +322,43 @@ class CharRange(Grammar):
 
     def attrs_dict(self) -> dict[str, Any]:
         return {
-            "char_ranges": self.char_ranges,
-            "negate": self.negate,
+            "char_ranges": list(self._char_ranges),
+            "negate": self._negate,
         }
+
+    def __hash__(self) -> int:
+        return self.structural_hash
+
+
+def _escape_range_char(char: str) -> str:
+    """Escape a character for use in a character range.
+
+    Args:
+        char (str): Character to escape.
+
+    Returns:
+        str: Escaped character.
+    """
+    if char in RANGE_ESCAPE_CHARS:
+        return "\\" + char
+    if char in ALWAYS_SAFE_CHARS:
+        return char
+    if char in CHAR_ESCAPE_MAP:
+        return CHAR_ESCAPE_MAP[char]
+    return char_to_hex(char)
+
+
+class _RangeEscapeTable(dict[int, str]):
+    """Escaped form of each character in a character range, computed and cached on first use."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: int) -> str:
+        escaped = self[key] = _escape_range_char(chr(key))
+        return escaped
+
+
+_RANGE_ESCAPE_TABLE: _RangeEscapeTable = _RangeEscapeTable(
+    (i, _escape_range_char(chr(i))) for i in range(256)
+)
+"""Escaped form of each character in a character range, keyed by ordinal. Latin-1 is filled in up front."""
@@ -44,7 +44,7 @@ class DerivationRule(Grammar):
         )
     """
 
-    __slots__: tuple[str, ...] = ("_symbol", "value")
+    __slots__: tuple[str, ...] = ("_symbol", "_value")
 
     separator: str = " ::= "
     """Separator metasymbol to use for the derivation rule."""
@@ -52,22 +52,9 @@ class DerivationRule(Grammar):
     def __init__(self, symbol: str, value: Grammar) -> None:
         super().__init__()
 
-        self._symbol: str
-        self.symbol = symbol
-
-        self.value: Grammar = value
-        """Grammar the symbol derives into."""
-
-    @property
-    def symbol(self) -> str:
-        """str: Symbol (non-terminal) for the derivation rule."""
-        return self._symbol
-
-    @symbol.setter
-    def symbol(self, value: str) -> None:
-        if not value:
+        if not symbol:
             raise ValueError("Derivation rule symbol cannot be empty")
-        prefix, trailing = value[0], value[1:]
+        prefix, trailing = symbol[0], symbol[1:]
         if not prefix.isalpha():
             raise ValueError(
                 "Derivation rule symbol must start with an alphabetic character (a-z, A-Z)"
@@ -76,14 +63,26 @@ class DerivationRule(Grammar):
             raise ValueError(
                 "Derivation rule symbol must contain only alphanumeric characters (a-z, A-Z, 0-9) and hyphens (-) after the first character"
             )
-        self._symbol = value.casefold()
-        if self._symbol != value:
+        self._symbol: str = symbol.casefold()
+        if self._symbol != symbol:
             logger.warning(
                 "Derivation rule symbols are case insensitive, used %r instead of %r",
                 self._symbol,
-                value,
+                symbol,
             )
 
+        self._value: Grammar = value
+
+    @property
+    def symbol(self) -> str:
+        """str: Symbol (non-terminal) for the derivation rule."""
+        return self._symbol
+
+    @property
+    def value(self) -> Grammar:
+        """Grammar: Grammar the symbol derives into."""
+        return self._value
+
     def render(self, full: bool = True, wrap: bool = True, **kwargs) -> str | None:
         """Render the grammar as a regular expression.
 
@@ -123,7 +122,7 @@ class DerivationRule(Grammar):
             return self._symbol
         kwargs["full"] = False
         kwargs["wrap"] = wrap
-        rendered = self.value.render(**kwargs)
+        rendered = self._value.render(**kwargs)
         if not rendered:
             return None
         expr = f"{self._symbol}{self.separator}{rendered}"
@@ -158,13 +157,16 @@ class DerivationRule(Grammar):
             >>> simplified_rule is None
             True
         """
-        simplified = self.value.simplify()
+        simplified = self._value.simplify()
         if simplified is None:
             return None
         return DerivationRule(self._symbol, simplified)
 
     def attrs_dict(self) -> dict[str, Any]:
-        return {"symbol": self._symbol, "value": self.value}
+        return {"symbol": self._symbol, "value": self._value}
+
+    def __hash__(self) -> int:
+        return self.structural_hash
 
     @override
     def as_string(self, indent: int | None = None, **kwargs) -> str:
@@ -5,10 +5,14 @@ Classes and utilities for logical AND operations.
 from __future__ import annotations
 
 import sys
-from collections import namedtuple
 from typing import TYPE_CHECKING, cast
 
-from grammatica.grammar.group.base import GroupGrammar
+from grammatica.grammar._intern import intern_grammar
+from grammatica.grammar.group.base import (
+    GroupGrammar,
+    merge_adjacent_default_groups,
+    resimplify_new_subexprs,
+)
 from grammatica.grammar.string import merge_adjacent_string_grammars
 
 if sys.version_info >= (3, 12):  # pragma: no cover
@@ -17,17 +21,11 @@ else:  # pragma: no cover
     from typing_extensions import override
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Iterable, Sequence
 
     from grammatica.grammar.base import Grammar
 
 
-GroupWeight: type[tuple] = namedtuple(
-    "GroupWeight",
-    ["removed_size", "chunk_size", "count"],
-)
-
-
 class And(GroupGrammar):
     """Grouped grammar that represents a logical AND operation between grammars.
 
@@ -67,6 +65,8 @@ class And(GroupGrammar):
         ("Bilbo" | "Frodo") " Baggins"
     """
 
+    __slots__: tuple[str, ...] = ()
+
     separator: str = " "
     """Separator to use for the grammar."""
 
@@ -169,7 +169,8 @@ class And(GroupGrammar):
         """
         return super().render(wrap=wrap, **kwargs)
 
-    def needs_wrapped(self) -> bool:
+    @override
+    def _check_needs_wrapped(self) -> bool:
         """Check if the expression needs to be wrapped in parentheses.
 
         Returns:
@@ -259,14 +260,13 @@ class And(GroupGrammar):
                 return False
             # Recursively look for the first non-default (1, 1) subexpression
             subexpr = self.subexprs[0]
-            wrap = isinstance(subexpr, GroupGrammar)
-            while (
-                wrap
-                and (cast(GroupGrammar, subexpr).quantifier == (1, 1))
-                and (len(cast(GroupGrammar, subexpr).subexprs) == 1)
-            ):
-                subexpr = cast(GroupGrammar, subexpr).subexprs[0]
-                wrap = isinstance(subexpr, GroupGrammar)
+            wrap = subexpr.is_group
+            while wrap:
+                group = cast(GroupGrammar, subexpr)
+                if (group.quantifier != (1, 1)) or (len(group.subexprs) != 1):
+                    break
+                subexpr = group.subexprs[0]
+                wrap = subexpr.is_group
             return wrap
         return self.quantifier != (1, 1)
 
@@ -278,7 +278,9 @@ class And(GroupGrammar):
         Simplifying grouped grammars is a complex operation, and requires recursively employing multiple strategies.
 
         Note:
-            The resulting grammar and its parts are copies, and the original grammar is not modified.
+            The original grammar is not modified, and parts that are already simple may be shared with the result.
+            Results are cached by structure, so simplifying equal grammars may return the same instance.
+            Simplifying a grammar that was returned by ``simplify`` returns it as-is.
 
         Returns:
             Grammar | None: Simplified expression, or None if resolved to empty.
@@ -450,16 +452,16 @@ class And(GroupGrammar):
 
     @staticmethod
     def simplify_subexprs(
-        original_subexprs: list[Grammar],
+        original_subexprs: Sequence[Grammar],
         quantifier: tuple[int, int | None],
     ) -> Grammar | None:
         """Simplify the provided subexpressions for the grouped grammar.
 
         Note:
-            The resulting grammar and its parts are copies, and the original grammar is not modified.
+            The original grammar is not modified, and parts that are already simple may be shared with the result.
 
         Args:
-            original_subexprs (list[Grammar]): Subexpressions to simplify.
+            original_subexprs (Sequence[Grammar]): Subexpressions to simplify.
             quantifier (tuple[int, int | None]): Quantifier for the expression.
 
         Returns:
@@ -469,76 +471,74 @@ class And(GroupGrammar):
             :meth:`grammatica.grammar.group.And.simplify`: High-level simplification of ``And`` grouped grammars.
         """
         subexprs: list[Grammar] = []
-        n = 0
         for subexpr in original_subexprs:
             simplified = subexpr.simplify()
             if simplified is None:
                 continue
             subexprs.append(simplified)
-            n += 1
 
-        # Empty expression is no-op
-        if n < 1:
-            return None
-
-        # And that is (1, n) or optional (0, n) containing subexpressions that are all optional (0, n) and are equivalent to each other (excluding quantifier) can be simplified to a single subexpression with a quantifier
-        # The upper bound of the quantifier is calculated by taking the sum of the upper bounds of the subexpressions and multiplying it by the upper bound of the outer expression
-        if (
-            quantifier[0] in (0, 1)
-            and all(
-                map(
-                    lambda x: isinstance(x, GroupGrammar) and x.quantifier[0] == 0,
-                    subexprs,
-                )
-            )
-            and all(
-                subexprs[i].equals(subexprs[i + 1], check_quantifier=False)
-                for i in range(n - 1)
-            )
-        ):
-            upper_bound = sum(
-                map(
-                    lambda x: cast(int, cast(GroupGrammar, x).quantifier[1]),
-                    subexprs,
-                )
-            ) * cast(int, quantifier[1])
-            return cast(GroupGrammar, subexprs[0]).simplify_subexprs(
-                cast(GroupGrammar, subexprs[0]).subexprs,
-                (0, upper_bound),
-            )
+        # Apply the strategies below until none of them apply, only simplifying subexpressions created along the way
+        while True:
+            n = len(subexprs)
+
+            # Empty expression is no-op
+            if n < 1:
+                return None
+
+            # And that is (1, n) or optional (0, n) containing subexpressions that are all optional (0, n) and are equivalent to each other (excluding quantifier) can be simplified to a single subexpression with a quantifier
+            # The upper bound of the quantifier is calculated by taking the sum of the upper bounds of the subexpressions and multiplying it by the upper bound of the outer expression
+            if (quantifier[0] in (0, 1)) and _are_equivalent_optional_groups(subexprs):
+                upper_bound = sum(
+                    cast(int, cast(GroupGrammar, x).quantifier[1]) for x in subexprs
+                ) * cast(int, quantifier[1])
+                first = cast(GroupGrammar, subexprs[0])
+                return first.simplify_subexprs(first.subexprs, (0, upper_bound))
+
+            if n == 1:
+                # Unwrap a single default (1, 1) subexpression
+                if quantifier == (1, 1):
+                    return subexprs[0]
+                # And that is optional (0, 1) can recursively unwrap to the first simple or non-single, non-default (1, 1), and non-optional (0, 1) grouped grammar.
+                if (
+                    (quantifier == (0, 1))
+                    and subexprs[0].is_group
+                    and (cast(GroupGrammar, subexprs[0]).quantifier in ((0, 1), (1, 1)))
+                ):
+                    subexprs = list(cast(GroupGrammar, subexprs[0]).subexprs)
+                    continue
 
-        if n == 1:
-            # Unwrap a single default (1, 1) subexpression
-            if quantifier == (1, 1):
-                return subexprs[0]
-            # And that is optional (0, 1) can recursively unwrap to the first simple or non-single, non-default (1, 1), and non-optional (0, 1) grouped grammar.
-            if (
-                (quantifier == (0, 1))
-                and isinstance(subexprs[0], GroupGrammar)
-                and (subexprs[0].quantifier in ((0, 1), (1, 1)))
+            previous = list(subexprs)
+            if merge_adjacent_default_and_grammars(subexprs, n) < n:
+                subexprs = resimplify_new_subexprs(subexprs, previous)
+                continue
+            if merge_adjacent_string_grammars(subexprs, n) < n:
+                subexprs = resimplify_new_subexprs(subexprs, previous)
+                continue
+            grouped, grouped_n = group_repeating_subexprs(subexprs, n)
+            if grouped_n < n:
+                subexprs = resimplify_new_subexprs(grouped, previous)
+                continue
+
+            # And that is optional (0, n) containing subexpressions that are all optional (0, n) does not need to then be optional itself
+            if (quantifier[0] == 0) and all(
+                x.is_group and (cast(GroupGrammar, x).quantifier[0] == 0)
+                for x in subexprs
             ):
-                return And.simplify_subexprs(subexprs[0].subexprs, quantifier)
-
-        merged_n = merge_adjacent_default_and_grammars(subexprs, n)
-        if merged_n < n:
-            return And.simplify_subexprs(subexprs, quantifier)
-        merged_n = merge_adjacent_string_grammars(subexprs, n)
-        if merged_n < n:
-            return And.simplify_subexprs(subexprs, quantifier)
-        grouped, grouped_n = group_repeating_subexprs(subexprs, n)
-        if grouped_n < n:
-            return And.simplify_subexprs(grouped, quantifier)
-
-        # And that is optional (0, n) containing subexpressions that are all optional (0, n) does not need to then be optional itself
-        if (quantifier[0] == 0) and all(
-            map(
-                lambda x: isinstance(x, GroupGrammar) and (x.quantifier[0] == 0),
-                subexprs,
-            )
-        ):
-            return And.simplify_subexprs(subexprs, (1, quantifier[1]))
+                quantifier = (1, quantifier[1])
+                continue
+
+            return intern_grammar(And(subexprs, quantifier=quantifier))
 
-        return And(subexprs, quantifier=quantifier)
+
+def _are_equivalent_optional_groups(subexprs: list[Grammar]) -> bool:
+    """Check if all subexpressions are optional (0, n) grouped grammars that are equal excluding quantifier."""
+    first = subexprs[0]
+    for subexpr in subexprs:
+        if not (subexpr.is_group and (cast(GroupGrammar, subexpr).quantifier[0] == 0)):
+            return False
+        if not first.equals(subexpr, check_quantifier=False):
+            return False
+    return True
 
 
 def merge_adjacent_default_and_grammars(subexprs: list[Grammar], n: int) -> int:
@@ -551,58 +551,7 @@ def merge_adjacent_default_and_grammars(subexprs: list[Grammar], n: int) -> int:
     Returns:
         int: Number of subexpressions after merging.
     """
-    if n < 2:
-        return n
-    last_idx = -1
-    for i in range(n - 1, -1, -1):
-        if isinstance(subexprs[i], And) and (
-            cast(And, subexprs[i]).quantifier == (1, 1)
-        ):
-            if last_idx < 1:
-                last_idx = i
-            else:
-                n -= 1
-        else:
-            if last_idx > 0:
-                subexprs[i + 1] = And(
-                    (
-                        s
-                        for subexpr in subexprs[i + 1 : last_idx + 1]
-                        for s in cast(And, subexpr).subexprs
-                    )
-                )
-                del subexprs[i + 2 : last_idx + 1]
-            last_idx = -1
-    if last_idx > 0:
-        subexprs[0] = And(
-            (
-                s
-                for subexpr in subexprs[0 : last_idx + 1]
-                for s in cast(And, subexpr).subexprs
-            )
-        )
-        del subexprs[1 : last_idx + 1]
-    return n
-
-
-def _iter_group_spans(n: int, size: int, offset: int) -> Iterator[tuple[int, int]]:
-    """Generate all possible index ranges that would produce slices of the provided size, starting at the provided offset.
-
-    Args:
-        n (int): Number of subexpressions.
-        size (int): Size of the group.
-        offset (int): Offset to start from.
-
-    Yields:
-        tuple[int, int]: Start and end indices of the group.
-            The range is inclusive, meaning both start and end indices are included.
-            For example, (0, 2) includes indices 0, 1, and 2.
-    """
-    for end in range(n - offset, size - 2, -size):
-        start = end - size
-        if start < 0:
-            return
-        yield start, end
+    return merge_adjacent_default_groups(subexprs, n, And)
 
 
 def group_repeating_subexprs(
@@ -611,6 +560,10 @@ def group_repeating_subexprs(
 ) -> tuple[list[Grammar], int]:
     """Group repeating sequences of subexpressions into a single subexpression.
 
+    Every maximal run of a repeating sequence is considered, regardless of where it starts, and the
+    run that removes the most subexpressions is grouped. Ties are broken by preferring the larger
+    chunk size, then the larger number of repetitions, then the leftmost run.
+
     Todo:
 
     * Split up strings into smaller strings when performing grouping (`.explode()`).
@@ -624,72 +577,78 @@ def group_repeating_subexprs(
     Returns:
         tuple[list[Grammar], int]: Grouped subexpressions and the number of subexpressions after grouping.
     """
-    best_subexprs = []
-    best_n = 0
-    best_weight = GroupWeight(0, 0, 0)
+    best_start = 0
+    # Weights are (removed_size, chunk_size, count), compared lexicographically
+    best_weight = (0, 0, 0)
+    # Compare the index of the first equal subexpression instead of comparing grammars
+    ids = _number_distinct_subexprs(subexprs[:n])
     max_chunk_size = n // 2
     for chunk_size in range(max_chunk_size, 0, -1):
-        max_offset_a = n - (chunk_size * 2)
-        max_offset_b = chunk_size - (1 + (n % chunk_size))
-        max_offset = max(max_offset_a, max_offset_b)
-        for offset in range(max_offset + 1):
-            count = 0
-            cmp_slice = []
-            start = 0  # Prevent unbounded warning
-            for start, end in _iter_group_spans(n, chunk_size, offset):
-                assert end - start == chunk_size
-                # Record initial slice to compare against
-                if count == 0:
-                    cmp_slice = subexprs[start:end]
-                    count += 1
-                    continue
+        run_start, weight = _best_repeating_run(ids, n, chunk_size)
+        if weight > best_weight:
+            best_start = run_start
+            best_weight = weight
+
+    if best_weight == (0, 0, 0):
+        return subexprs, n
+    # Only the best run is materialized
+    removed_size, chunk_size, count = best_weight
+    best_end = best_start + (count * chunk_size)
+    grouped_grammar = And(
+        subexprs[best_start : best_start + chunk_size],
+        quantifier=(count, count),
+    )
+    best_subexprs = subexprs[:best_start] + [grouped_grammar] + subexprs[best_end:]
+    return best_subexprs, n - removed_size
+
+
+def _best_repeating_run(
+    ids: list[int],
+    n: int,
+    chunk_size: int,
+) -> tuple[int, tuple[int, int, int]]:
+    """Find the leftmost run with the best weight that repeats with a period of the chunk size.
 
-                # Record additional matching slice
-                if cmp_slice == subexprs[start:end]:
-                    count += 1
-                    continue
+    Args:
+        ids (list[int]): Numbers of the subexpressions, equal for equal subexpressions.
+        n (int): Number of subexpressions.
+        chunk_size (int): Size of the repeating chunk.
 
-                # Yield variation of subexpressions where repeating slices are grouped inside a grammar
-                if count > 1:
-                    new_n = n - (count * chunk_size) + 1
-                    weight = GroupWeight(n - new_n, chunk_size, count)
-                    if weight > best_weight:
-                        grouped_grammar = And(
-                            subexprs[start : start + chunk_size],
-                            quantifier=(count, count),
-                        )
-                        best_subexprs = (
-                            subexprs[:start]
-                            + [grouped_grammar]
-                            + subexprs[start + (count * chunk_size) :]
-                        )
-                        best_n = new_n
-                        best_weight = weight
-
-                # Reset comparison slice
-                cmp_slice = subexprs[start:end]
-                count = 1
-
-            if count > 1:
-                new_n = n - (count * chunk_size) + 1
-                weight = GroupWeight(n - new_n, chunk_size, count)
-                if weight > best_weight:
-                    grouped_grammar = And(
-                        subexprs[start : start + chunk_size],
-                        quantifier=(count, count),
-                    )
-                    best_subexprs = (
-                        subexprs[:start]
-                        + [grouped_grammar]
-                        + subexprs[start + (count * chunk_size) :]
-                    )
-                    best_n = new_n
-                    best_weight = weight
-
-    if best_weight > GroupWeight(0, 0, 0):
-        assert len(best_subexprs) > 0
-        assert best_n > 0
-        return best_subexprs, best_n
-    assert len(best_subexprs) == 0
-    assert best_n == 0
-    return subexprs, n
+    Returns:
+        tuple[int, tuple[int, int, int]]: Start of the run and its (removed_size, chunk_size, count) weight,
+            or a weight of (0, 0, 0) if nothing repeats.
+    """
+    best_start = 0
+    best_weight = (0, 0, 0)
+    # A run of matches, where each subexpression equals the one a chunk ahead of it, spans
+    # (run_length + chunk_size) subexpressions that repeat with a period of chunk_size
+    run_start = 0
+    run_length = 0
+    for i in range(n - chunk_size + 1):
+        if (i < n - chunk_size) and (ids[i] == ids[i + chunk_size]):
+            if run_length == 0:
+                run_start = i
+            run_length += 1
+            continue
+        count = (run_length + chunk_size) // chunk_size
+        run_length = 0
+        if count < 2:
+            continue
+        weight = ((count * chunk_size) - 1, chunk_size, count)
+        if weight > best_weight:
+            best_start = run_start
+            best_weight = weight
+    return best_start, best_weight
+
+
+def _number_distinct_subexprs(subexprs: list[Grammar]) -> list[int]:
+    """Number each subexpression by the index of the first subexpression equal to it."""
+    first_indexes: dict[Grammar, int] = {}
+    numbers: list[int] = []
+    for i, subexpr in enumerate(subexprs):
+        try:
+            numbers.append(first_indexes.setdefault(subexpr, i))
+        except TypeError:
+            # Grammars that are not hashable are compared by equality instead
+            numbers.append(subexprs.index(subexpr))
+    return numbers
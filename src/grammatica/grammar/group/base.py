@@ -8,7 +8,12 @@ from __future__ import annotations
 
 import sys
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    TypeVar,
+    cast,
+)
 
 from grammatica.grammar.base import Grammar, value_to_string
 
@@ -19,10 +24,24 @@ else:  # pragma: no cover
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
     from typing import Any
 
 
+GG = TypeVar("GG", bound="GroupGrammar")
+
+_FIXED_QUANTIFIERS: dict[tuple[int, int | None], str | None] = {
+    (1, 1): None,
+    (0, 1): "?",
+    (0, None): "*",
+    (1, None): "+",
+}
+"""Rendered quantifiers that do not depend on the bounds."""
+
+_NOT_SIMPLIFIED: object = object()
+"""Placeholder for a grammar that has not been simplified yet."""
+
+
 class GroupGrammar(Grammar, ABC):
     """Base class for grouped grammar expressions.
 
@@ -36,11 +55,21 @@ class GroupGrammar(Grammar, ABC):
         ValueError: Range lower bound is greater than range upper bound.
     """
 
-    __slots__: tuple[str, ...] = ("separator", "subexprs", "quantifier")
+    __slots__: tuple[str, ...] = (
+        "separator",
+        "_subexprs",
+        "_quantifier",
+        "_rendered",
+        "_needs_wrapped",
+        "_simplified",
+    )
 
     separator: str
     """Separator to use for the grammar."""
 
+    is_group: bool = True
+    """Whether the grammar is a grouped grammar."""
+
     def __init__(
         self,
         *,
@@ -49,9 +78,6 @@ class GroupGrammar(Grammar, ABC):
     ) -> None:
         super().__init__()
 
-        self.subexprs: list[Grammar] = list(subexprs)
-        """Group of grammars."""
-
         lower: int
         upper: int | None
         if isinstance(quantifier, int):
@@ -69,8 +95,53 @@ class GroupGrammar(Grammar, ABC):
                 raise ValueError(
                     f"Range lower bound must be <= range upper bound: {quantifier}"
                 )
-        self.quantifier: tuple[int, int | None] = (lower, upper)
-        """Minimum and maximum repetitions the expression must match."""
+        self._init_fields(subexprs, (lower, upper))
+
+    def _init_fields(
+        self,
+        subexprs: Iterable[Grammar],
+        quantifier: tuple[int, int | None],
+    ) -> None:
+        """Set the fields of the grammar from a validated quantifier.
+
+        Args:
+            subexprs (Iterable[Grammar]): Group of grammars.
+            quantifier (tuple[int, int | None]): Validated minimum and maximum repetitions.
+        """
+        self._subexprs: tuple[Grammar, ...] = tuple(subexprs)
+
+        self._quantifier: tuple[int, int | None] = quantifier
+
+        self._rendered: dict[bool, str | None] = {}
+
+        self._needs_wrapped: bool | None = None
+
+        self._simplified: Grammar | object | None = _NOT_SIMPLIFIED
+
+    @property
+    def subexprs(self) -> tuple[Grammar, ...]:
+        """tuple[Grammar, ...]: Group of grammars."""
+        return self._subexprs
+
+    @property
+    def quantifier(self) -> tuple[int, int | None]:
+        """tuple[int, int | None]: Minimum and maximum repetitions the expression must match."""
+        return self._quantifier
+
+    @classmethod
+    def _from_validated(cls: type[GG], subexprs: Iterable[Grammar]) -> GG:
+        """Create a grammar with the default quantifier without validating it.
+
+        Args:
+            subexprs (Iterable[Grammar]): Group of grammars.
+
+        Returns:
+            GG: Grammar with the provided subexpressions and a quantifier of (1, 1).
+        """
+        grammar = cls.__new__(cls)
+        Grammar.__init__(grammar)
+        grammar._init_fields(subexprs, (1, 1))
+        return grammar
 
     def render(self, wrap: bool = True, **kwargs) -> str | None:
         """Render the grammar as a regular expression.
@@ -82,21 +153,28 @@ class GroupGrammar(Grammar, ABC):
         Returns:
             str | None: Rendered expression, or None if resolved to empty.
         """
-        if len(self.subexprs) < 1:
+        # Rendered output only depends on wrap, since children are always rendered with full=False
+        cacheable = kwargs.keys() <= {"full"}
+        if cacheable and (wrap in self._rendered):
+            return self._rendered[wrap]
+        expr = self._render(wrap, **kwargs)
+        if cacheable:
+            self._rendered[wrap] = expr
+        return expr
+
+    def _render(self, wrap: bool, **kwargs) -> str | None:
+        if len(self._subexprs) < 1:
             return None
         rendered_quantifier = self.render_quantifier()
-        expr = ""
-        found = False
-        for subexpr in self.subexprs:
-            kwargs["full"] = False
+        kwargs["full"] = False
+        parts: list[str] = []
+        for subexpr in self._subexprs:
             rendered = subexpr.render(**kwargs)
             if rendered is not None:
-                if found:
-                    expr += self.separator
-                expr += rendered
-                found = True
-        if not found:
+                parts.append(rendered)
+        if not parts:
             return None
+        expr = self.separator.join(parts)
         if self.needs_wrapped() and (wrap or (rendered_quantifier is not None)):
             expr = "(" + expr + ")"
         if rendered_quantifier is not None:
@@ -109,31 +187,26 @@ class GroupGrammar(Grammar, ABC):
         Returns:
             str | None: A quantifier string or None if not applicable.
         """
-        lower, upper = self.quantifier
-        if lower == upper == 1:
-            return None
-        if lower == 0:
-            if upper is None:
-                return "*"
-            if upper == 1:
-                return "?"
-            # NOTE: Not supported by llama.cpp
-            # return "{," + str(upper) + "}"
+        if self._quantifier in _FIXED_QUANTIFIERS:
+            return _FIXED_QUANTIFIERS[self._quantifier]
+        lower, upper = self._quantifier
+        # NOTE: (0, n) is rendered as {0,n}, since {,n} is not supported by llama.cpp
         if upper is None:
-            if lower == 1:
-                return "+"
             return "{" + str(lower) + ",}"
         if lower == upper:
             return "{" + str(lower) + "}"
         return "{" + str(lower) + "," + str(upper) + "}"
 
     def simplify(self) -> Grammar | None:
-        return self.simplify_subexprs(self.subexprs, self.quantifier)
+        # Keep the result on the node, where grammars that are already simple keep themselves
+        if self._simplified is _NOT_SIMPLIFIED:
+            self._simplified = self.simplify_subexprs(self._subexprs, self._quantifier)
+        return cast("Grammar | None", self._simplified)
 
     @staticmethod
     @abstractmethod
     def simplify_subexprs(
-        original_subexprs: list[Grammar],
+        original_subexprs: Sequence[Grammar],
         quantifier: tuple[int, int | None],
     ) -> Grammar | None:
         """Simplify the provided subexpressions for the grouped grammar.
@@ -141,10 +214,10 @@ class GroupGrammar(Grammar, ABC):
         Simplifying grouped grammars is a complex operation, and requires recursively employing multiple strategies.
 
         Note:
-            The resulting grammar and its parts are copies, and the original grammar is not modified.
+            The original grammar is not modified, and parts that are already simple may be shared with the result.
 
         Args:
-            original_subexprs (list[Grammar]): Subexpressions to simplify.
+            original_subexprs (Sequence[Grammar]): Subexpressions to simplify.
             quantifier (tuple[int, int | None]): Quantifier for the expression.
 
         Returns:
@@ -152,10 +225,21 @@ class GroupGrammar(Grammar, ABC):
         """
         return None
 
-    @abstractmethod
     def needs_wrapped(self) -> bool:
         """Check if the expression needs to be wrapped in parentheses.
 
+        The check is only done once, and the result is kept on the grammar.
+
+        Returns:
+            bool: True if the expression needs to be wrapped, False otherwise.
+        """
+        if self._needs_wrapped is None:
+            self._needs_wrapped = self._check_needs_wrapped()
+        return self._needs_wrapped
+
+    def _check_needs_wrapped(self) -> bool:
+        """Check if the expression needs to be wrapped in parentheses.
+
         Returns:
             bool: True if the expression needs to be wrapped, False otherwise.
         """
@@ -177,23 +261,32 @@ class GroupGrammar(Grammar, ABC):
             return True
         if not isinstance(other, type(self)):
             return False
+        if check_quantifier and (self._quantifier != other.quantifier):
+            return False
+        if self._subexprs != other.subexprs:
+            return False
+        # Subclasses may add attributes of their own, which are compared as well
+        if (type(self).attrs_dict is GroupGrammar.attrs_dict) and (
+            type(other).attrs_dict is GroupGrammar.attrs_dict
+        ):
+            return True
         attrs = self.attrs_dict()
         other_attrs = other.attrs_dict()
-        if not check_quantifier:
-            return {k: attrs[k] for k in sorted(attrs) if (k != "quantifier")} == {
-                k: other_attrs[k] for k in sorted(other_attrs) if (k != "quantifier")
-            }
-        return {k: attrs[k] for k in sorted(attrs)} == {
-            k: other_attrs[k] for k in sorted(other_attrs)
-        }
+        for key in ("subexprs", "quantifier"):
+            attrs.pop(key, None)
+            other_attrs.pop(key, None)
+        return attrs == other_attrs
 
     @override
     def attrs_dict(self) -> dict[str, Any]:
         return {
-            "subexprs": self.subexprs,
-            "quantifier": self.quantifier,
+            "subexprs": list(self._subexprs),
+            "quantifier": self._quantifier,
         } | super().attrs_dict()
 
+    def __hash__(self) -> int:
+        return self.structural_hash
+
     @override
     def as_string(self, indent: int | None = None, **kwargs) -> str:
         """Return a string representation of the grammar.
@@ -232,3 +325,90 @@ class GroupGrammar(Grammar, ABC):
                     msg += "\n"
         msg += ")"
         return msg
+
+
+def resimplify_new_subexprs(
+    subexprs: list[Grammar],
+    previous: list[Grammar],
+    unique: bool = False,
+) -> list[Grammar]:
+    """Simplify subexpressions that are not present in a previous list of simplified subexpressions.
+
+    Subexpressions are compared by identity, so subexpressions carried over from ``previous`` are kept as-is
+    and only the subexpressions created since (e.g. by merging) are simplified.
+
+    Args:
+        subexprs (list[Grammar]): Subexpressions to simplify.
+        previous (list[Grammar]): Subexpressions that are already simplified.
+        unique (bool, optional): Remove duplicate subexpressions. Defaults to False.
+
+    Returns:
+        list[Grammar]: Simplified subexpressions, excluding those that simplified to None.
+    """
+    known = set(map(id, previous))
+    seen: set[Grammar] = set()
+    result: list[Grammar] = []
+    for subexpr in subexprs:
+        if id(subexpr) not in known:
+            simplified = subexpr.simplify()
+            if simplified is None:
+                continue
+            subexpr = simplified
+        if unique:
+            try:
+                if subexpr in seen:
+                    continue
+                seen.add(subexpr)
+            except TypeError:
+                # Grammars that are not hashable are compared by equality instead
+                if subexpr in result:
+                    continue
+        result.append(subexpr)
+    return result
+
+
+def merge_adjacent_default_groups(
+    subexprs: list[Grammar],
+    n: int,
+    group_cls: type[GroupGrammar],
+) -> int:
+    """Merge adjacent grouped expressions of the provided type having default quantifier (1, 1) in-place.
+
+    Args:
+        subexprs (list[Grammar]): Subexpressions to merge.
+        n (int): Number of subexpressions.
+        group_cls (type[GroupGrammar]): Type of grouped grammar to merge.
+
+    Returns:
+        int: Number of subexpressions after merging.
+    """
+    if n < 2:
+        return n
+
+    # Merged subexpressions are written back in-place, which never overtakes the read position
+    write = 0
+    i = 0
+    while i < n:
+        # Find the end of the run of default grammars starting at i
+        j = i
+        while j < n:
+            subexpr = subexprs[j]
+            if not (isinstance(subexpr, group_cls) and (subexpr.quantifier == (1, 1))):
+                break
+            j += 1
+        if j - i > 1:
+            # The merged grammars are already validated, so the quantifier check is skipped
+            # pylint: disable-next=protected-access
+            subexprs[write] = group_cls._from_validated(
+                chain.from_iterable(
+                    cast(GroupGrammar, s).subexprs for s in subexprs[i:j]
+                )
+            )
+            i = j
+        else:
+            subexprs[write] = subexprs[i]
+            i += 1
+        write += 1
+
+    del subexprs[write:n]
+    return write
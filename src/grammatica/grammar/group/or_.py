@@ -7,8 +7,13 @@ from __future__ import annotations
 import sys
 from typing import TYPE_CHECKING, cast
 
+from grammatica.grammar._intern import intern_grammar
 from grammatica.grammar.group.and_ import And
-from grammatica.grammar.group.base import GroupGrammar
+from grammatica.grammar.group.base import (
+    GroupGrammar,
+    merge_adjacent_default_groups,
+    resimplify_new_subexprs,
+)
 
 if sys.version_info >= (3, 12):  # pragma: no cover
     from typing import override
@@ -16,7 +21,7 @@ else:  # pragma: no cover
     from typing_extensions import override
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
     from grammatica.grammar.base import Grammar
 
@@ -41,6 +46,8 @@ class Or(GroupGrammar):
         Or(subexprs=[String(value='yes'), String(value='no')], quantifier=(1, 1))
     """
 
+    __slots__: tuple[str, ...] = ()
+
     separator: str = " | "
     """Separator to use for the grammar."""
 
@@ -112,7 +119,8 @@ class Or(GroupGrammar):
         """
         return super().render(wrap=wrap, **kwargs)
 
-    def needs_wrapped(self) -> bool:
+    @override
+    def _check_needs_wrapped(self) -> bool:
         """Check if the expression needs to be wrapped in parentheses.
 
         Returns:
@@ -194,14 +202,13 @@ class Or(GroupGrammar):
                 return False
             # Recursively look for the first non-default (1, 1) subexpression
             subexpr = self.subexprs[0]
-            wrap = isinstance(subexpr, GroupGrammar)
-            while (
-                wrap
-                and (cast(GroupGrammar, subexpr).quantifier == (1, 1))
-                and (len(cast(GroupGrammar, subexpr).subexprs) == 1)
-            ):
-                subexpr = cast(GroupGrammar, subexpr).subexprs[0]
-                wrap = isinstance(subexpr, GroupGrammar)
+            wrap = subexpr.is_group
+            while wrap:
+                group = cast(GroupGrammar, subexpr)
+                if (group.quantifier != (1, 1)) or (len(group.subexprs) != 1):
+                    break
+                subexpr = group.subexprs[0]
+                wrap = subexpr.is_group
             return wrap
         return True
 
@@ -213,7 +220,9 @@ class Or(GroupGrammar):
         Simplifying grouped grammars is a complex operation, and requires recursively employing multiple strategies.
 
         Note:
-            The resulting grammar and its parts are copies, and the original grammar is not modified.
+            The original grammar is not modified, and parts that are already simple may be shared with the result.
+            Results are cached by structure, so simplifying equal grammars may return the same instance.
+            Simplifying a grammar that was returned by ``simplify`` returns it as-is.
 
         Returns:
             Grammar | None: Simplified expression, or None if resolved to empty.
@@ -333,16 +342,16 @@ class Or(GroupGrammar):
 
     @staticmethod
     def simplify_subexprs(
-        original_subexprs: list[Grammar],
+        original_subexprs: Sequence[Grammar],
         quantifier: tuple[int, int | None],
     ) -> Grammar | None:
         """Simplify the provided subexpressions for the grouped grammar.
 
         Note:
-            The resulting grammar and its parts are copies, and the original grammar is not modified.
+            The original grammar is not modified, and parts that are already simple may be shared with the result.
 
         Args:
-            original_subexprs (list[Grammar]): Subexpressions to simplify.
+            original_subexprs (Sequence[Grammar]): Subexpressions to simplify.
             quantifier (tuple[int, int | None]): Quantifier for the expression.
 
         Returns:
@@ -352,48 +361,59 @@ class Or(GroupGrammar):
             :meth:`grammatica.grammar.group.Or.simplify`: High-level simplification of ``Or`` grouped grammars.
         """
         subexprs: list[Grammar] = []
-        n = 0
+        seen: set[Grammar] = set()
         for subexpr in original_subexprs:
             simplified = subexpr.simplify()
             if simplified is None:
                 continue
-            if simplified in subexprs:
-                continue
+            try:
+                if simplified in seen:
+                    continue
+                seen.add(simplified)
+            except TypeError:
+                # Grammars that are not hashable are compared by equality instead
+                if simplified in subexprs:
+                    continue
             subexprs.append(simplified)
-            n += 1
 
-        # Empty expression is no-op
-        if n < 1:
-            return None
+        # Apply the strategies below until none of them apply, only simplifying subexpressions created along the way
+        while True:
+            n = len(subexprs)
+
+            # Empty expression is no-op
+            if n < 1:
+                return None
+
+            if n == 1:
+                # Unwrap a single default (1, 1) subexpression
+                if quantifier == (1, 1):
+                    return subexprs[0]
+                # Or that is optional (0, 1) can recursively unwrap to the first simple or non-single, non-default (1, 1), and non-optional (0, 1) grouped grammar.
+                if (
+                    (quantifier == (0, 1))
+                    and subexprs[0].is_group
+                    and (cast(GroupGrammar, subexprs[0]).quantifier in ((0, 1), (1, 1)))
+                ):
+                    return And.simplify_subexprs(
+                        cast(GroupGrammar, subexprs[0]).subexprs, quantifier
+                    )
+                # Or with a single subexpression is the same as And with a single subexpression
+                return And.simplify_subexprs(subexprs, quantifier)
 
-        if n == 1:
-            # Unwrap a single default (1, 1) subexpression
-            if quantifier == (1, 1):
-                return subexprs[0]
-            # Or that is optional (0, 1) can recursively unwrap to the first simple or non-single, non-default (1, 1), and non-optional (0, 1) grouped grammar.
-            if (
-                (quantifier == (0, 1))
-                and isinstance(subexprs[0], GroupGrammar)
-                and (subexprs[0].quantifier in ((0, 1), (1, 1)))
+            previous = list(subexprs)
+            if merge_adjacent_default_or_grammars(subexprs, n) < n:
+                subexprs = resimplify_new_subexprs(subexprs, previous, unique=True)
+                continue
+
+            # Or that is optional (0, n) containing subexpressions that are all optional (0, n) does not need to then be optional itself
+            if (quantifier[0] == 0) and all(
+                x.is_group and (cast(GroupGrammar, x).quantifier[0] == 0)
+                for x in subexprs
             ):
-                return And.simplify_subexprs(subexprs[0].subexprs, quantifier)
-            # Or with a single subexpression is the same as And with a single subexpression
-            return And.simplify_subexprs(subexprs, quantifier)
-
-        merged_n = merge_adjacent_default_or_grammars(subexprs, n)
-        if merged_n < n:
-            return Or.simplify_subexprs(subexprs, quantifier)
-
-        # Or that is optional (0, n) containing subexpressions that are all optional (0, n) does not need to then be optional itself
-        if (quantifier[0] == 0) and all(
-            map(
-                lambda x: isinstance(x, GroupGrammar) and (x.quantifier[0] == 0),
-                subexprs,
-            )
-        ):
-            return Or.simplify_subexprs(subexprs, (1, quantifier[1]))
+                quantifier = (1, quantifier[1])
+                continue
 
-        return Or(subexprs, quantifier=quantifier)
+            return intern_grammar(Or(subexprs, quantifier=quantifier))
 
 
 def merge_adjacent_default_or_grammars(subexprs: list[Grammar], n: int) -> int:
@@ -406,33 +426,4 @@ def merge_adjacent_default_or_grammars(subexprs: list[Grammar], n: int) -> int:
     Returns:
         int: Number of subexpressions after merging.
     """
-    if n < 2:
-        return n
-    last_idx = -1
-    for i in range(n - 1, -1, -1):
-        if isinstance(subexprs[i], Or) and (cast(Or, subexprs[i]).quantifier == (1, 1)):
-            if last_idx < 1:
-                last_idx = i
-            else:
-                n -= 1
-        else:
-            if last_idx > 0:
-                subexprs[i + 1] = Or(
-                    (
-                        s
-                        for subexpr in subexprs[i + 1 : last_idx + 1]
-                        for s in cast(Or, subexpr).subexprs
-                    )
-                )
-                del subexprs[i + 2 : last_idx + 1]
-            last_idx = -1
-    if last_idx > 0:
-        subexprs[0] = Or(
-            (
-                s
-                for subexpr in subexprs[0 : last_idx + 1]
-                for s in cast(Or, subexpr).subexprs
-            )
-        )
-        del subexprs[1 : last_idx + 1]
-    return n
+    return merge_adjacent_default_groups(subexprs, n, Or)
@@ -4,14 +4,22 @@ Classes and utilities for string literal expressions.
 
 from __future__ import annotations
 
+import re
 import sys
-from typing import TYPE_CHECKING, cast
+from functools import lru_cache
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    TypeVar,
+    cast,
+)
 
 from grammatica.constants import (
     ALWAYS_SAFE_CHARS,
     CHAR_ESCAPE_MAP,
     STRING_LITERAL_ESCAPE_CHARS,
 )
+from grammatica.grammar._intern import intern_grammar
 from grammatica.grammar.base import Grammar
 from grammatica.utils import char_to_hex
 
@@ -24,6 +32,8 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
     from typing import Any
 
+S = TypeVar("S", bound="String")
+
 
 class String(Grammar):
     """Grammar that exactly matches a string.
@@ -38,13 +48,43 @@ class String(Grammar):
         String(value='gandalf')
     """
 
-    __slots__: tuple[str, ...] = ("value",)
+    __slots__: tuple[str, ...] = ("_value", "_rendered")
 
     def __init__(self, value: Iterable[str]) -> None:
         super().__init__()
 
-        self.value: str = str(value)
-        """String to match exactly."""
+        # str subclasses are converted to plain strings
+        # pylint: disable-next=unidiomatic-typecheck
+        self._value: str = value if type(value) is str else str(value)
+
+        self._rendered: str | None = None
+
+    @property
+    def value(self) -> str:
+        """str: String to match exactly."""
+        return self._value
+
+    @classmethod
+    def of(cls: type[S], value: str) -> S:
+        """Get a shared grammar that exactly matches a string.
+
+        Grammars for short strings are kept for reuse, and equal strings that are still in use share a single instance.
+
+        Args:
+            value (str): String to match exactly.
+
+        Returns:
+            S: Shared grammar for the string, of the type it was called on.
+
+        Examples:
+            >>> from grammatica.grammar import String
+            >>> String.of("gandalf") is String.of("gandalf")
+            True
+        """
+        # Only plain strings are kept for reuse, so subclasses get an instance of their own type
+        if (cls is String) and (len(value) <= _MAX_CACHED_LENGTH):
+            return cast(S, _cached_string(value))
+        return intern_grammar(cls(value))
 
     def render(self, **kwargs) -> str | None:
         """Render the grammar as a regular expression.
@@ -84,9 +124,21 @@ class String(Grammar):
             >>> g.render() is None
             True
         """
-        if len(self.value) == 0:
+        if self._rendered is not None:
+            return self._rendered
+        value = self._value
+        if len(value) == 0:
             return None
-        return '"' + "".join(map(self._escape, self.value)) + '"'
+        # Only escape from the first character that is not always safe
+        match = _UNSAFE_CHAR_PATTERN.search(value)
+        if match is None:
+            self._rendered = '"' + value + '"'
+        else:
+            start = match.start()
+            self._rendered = (
+                '"' + value[:start] + value[start:].translate(_ESCAPE_TABLE) + '"'
+            )
+        return self._rendered
 
     def simplify(self) -> String | None:
         """Simplify the grammar.
@@ -94,17 +146,15 @@ class String(Grammar):
         Attempts to reduce redundancy and optimize the grammar.
 
         Returns:
-            String | None: Copy of the grammar, or None if resolved to empty.
+            String | None: The grammar itself, or None if resolved to empty.
 
         Examples:
-            Non-empty strings remain unchanged
+            Non-empty strings are already as simple as possible and are returned as-is
 
             >>> from grammatica.grammar import String
             >>> original = String("hello")
             >>> simplified = original.simplify()
-            >>> original == simplified
-            True
-            >>> original is not simplified
+            >>> original is simplified
             True
 
             Empty strings are simplified to :py:obj:`None`
@@ -114,35 +164,90 @@ class String(Grammar):
             >>> g.simplify() is None
             True
         """
+        # Strings are immutable, so there is nothing to copy
         if len(self.value) == 0:
             return None
-        return String(self.value)
+        return self
 
-    @staticmethod
-    def _escape(char: str) -> str:
-        """Escape a character for use in a string literal.
+    @override
+    def equals(self, other: Any, **kwargs) -> bool:
+        """Check equality with another value.
 
         Args:
-            char (str): Character to escape.
+            other (Any): Value to compare against.
+            **kwargs: Keyword arguments for the current context.
 
         Returns:
-            str: Escaped character.
+            bool: True if the values are equal, False otherwise.
         """
-        if char in ALWAYS_SAFE_CHARS:
-            return char
-        if char in CHAR_ESCAPE_MAP:
-            return CHAR_ESCAPE_MAP[char]
-        if char in STRING_LITERAL_ESCAPE_CHARS:
-            return "\\" + char
-        return char_to_hex(char)
+        if self is other:
+            return True
+        if not isinstance(other, type(self)):
+            return False
+        return self.value == other.value
 
     def attrs_dict(self) -> dict[str, Any]:
         return {"value": self.value}
 
+    def __hash__(self) -> int:
+        return self.structural_hash
+
+
+def _escape_char(char: str) -> str:
+    """Escape a character for use in a string literal.
+
+    Args:
+        char (str): Character to escape.
+
+    Returns:
+        str: Escaped character.
+    """
+    if char in ALWAYS_SAFE_CHARS:
+        return char
+    if char in CHAR_ESCAPE_MAP:
+        return CHAR_ESCAPE_MAP[char]
+    if char in STRING_LITERAL_ESCAPE_CHARS:
+        return "\\" + char
+    return char_to_hex(char)
+
+
+class _EscapeTable(dict[int, str]):
+    """Escaped form of each character, computed and cached on first use."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: int) -> str:
+        escaped = self[key] = _escape_char(chr(key))
+        return escaped
+
+
+_ESCAPE_TABLE: _EscapeTable = _EscapeTable(
+    (i, _escape_char(chr(i))) for i in range(256)
+)
+"""Escaped form of each character, for use with :meth:`str.translate`. Latin-1 is filled in up front."""
+
+_UNSAFE_CHAR_PATTERN: re.Pattern[str] = re.compile(
+    "[^" + re.escape("".join(sorted(ALWAYS_SAFE_CHARS))) + "]"
+)
+"""Pattern matching any character that is not always safe."""
+
+_get_value = attrgetter("value")
+"""Get the value of a String grammar."""
+
+_MAX_CACHED_LENGTH: int = 64
+"""Longest string whose grammar is kept for reuse by :meth:`String.of`."""
+
+
+@lru_cache(maxsize=4096)
+def _cached_string(value: str) -> String:
+    return intern_grammar(String(value))
+
 
 def merge_adjacent_string_grammars(subexprs: list[Grammar], n: int) -> int:
     """Merge adjacent String grammars in-place.
 
+    Only grammars that are exactly of type String are merged, and subclasses are left as-is.
+
     Args:
         subexprs (list[Grammar]): Subexpressions to merge.
         n (int): Number of subexpressions.
@@ -153,27 +258,24 @@ def merge_adjacent_string_grammars(subexprs: list[Grammar], n: int) -> int:
     if n < 2:
         return n
 
-    last_idx = -1
-    for i in range(n - 1, -1, -1):
-        if isinstance(subexprs[i], String):
-            if last_idx < 1:
-                last_idx = i
-            else:
-                n -= 1
+    # Merged subexpressions are written back in-place, which never overtakes the read position
+    write = 0
+    i = 0
+    while i < n:
+        # Find the end of the run of strings starting at i
+        j = i
+        # String subclasses are not merged
+        # pylint: disable-next=unidiomatic-typecheck
+        while (j < n) and (type(subexprs[j]) is String):
+            j += 1
+        if j - i > 1:
+            value = "".join(map(_get_value, subexprs[i:j]))
+            subexprs[write] = String.of(value)
+            i = j
         else:
-            if last_idx > 0:
-                subexprs[i + 1] = String(
-                    "".join(
-                        cast(String, s).value for s in subexprs[i + 1 : last_idx + 1]
-                    )
-                )
-                del subexprs[i + 2 : last_idx + 1]
-            last_idx = -1
-
-    if last_idx > 0:
-        subexprs[0] = String(
-            "".join(cast(String, s).value for s in subexprs[0 : last_idx + 1])
-        )
-        del subexprs[1 : last_idx + 1]
-
-    return n
+            subexprs[write] = subexprs[i]
+            i += 1
+        write += 1
+
+    del subexprs[write:n]
+    return write
@@ -2,6 +2,8 @@
 Utility functions.
 """
 
+from functools import lru_cache
+
 __all__ = [
     "char_to_cpoint",
     "char_to_hex",
@@ -14,6 +16,7 @@ def char_to_cpoint(char: str) -> str:
     return ord_to_cpoint(ord(char))
 
 
+@lru_cache(maxsize=4096)
 def ord_to_cpoint(ordinal: int) -> str:
     if ordinal < 0x10000:
         return f"\\u{ordinal:04X}"
@@ -25,4 +28,10 @@ def char_to_hex(char: str) -> str:
 
 
 def ord_to_hex(ordinal: int) -> str:
+    if 0 <= ordinal < 256:
+        return _HEX_LUT[ordinal]
     return f"\\x{ordinal:02X}"
+
+
+_HEX_LUT: tuple[str, ...] = tuple(f"\\x{i:02X}" for i in range(256))
+"""Hexadecimal escape of each byte."""
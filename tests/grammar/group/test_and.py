@@ -6,15 +6,9 @@ from grammatica.grammar.group import (
     Or,
     merge_adjacent_default_and_grammars,
 )
+from grammatica.grammar.group.and_ import group_repeating_subexprs
 
-try:
-    from ..helpers import fmt_result
-except ImportError:
-    import sys
-    from os import path
-
-    sys.path.append(path.dirname(path.dirname(path.dirname(path.abspath(__file__)))))
-    from helpers import fmt_result
+from ..helpers import UnhashableGrammar, fmt_result
 
 
 @pytest.mark.parametrize(
@@ -186,6 +180,40 @@ except ImportError:
             ),
             "expected": Or([String("a"), String("b")], quantifier=(0, 3)),
         },
+        {
+            "description": "And with simple repeating subexpression after a leading subexpression",
+            "grammar": And(
+                [
+                    CharRange([("a", "z")]),
+                    CharRange([("0", "9")]),
+                    CharRange([("0", "9")]),
+                ],
+            ),
+            "expected": And(
+                [
+                    CharRange([("a", "z")]),
+                    And([CharRange([("0", "9")])], quantifier=(2, 2)),
+                ],
+            ),
+        },
+        {
+            "description": "And with overlapping repeating subexpressions groups the leftmost run",
+            "grammar": And(
+                [
+                    CharRange([("a", "z")]),
+                    CharRange([("0", "9")]),
+                    CharRange([("a", "z")]),
+                    CharRange([("0", "9")]),
+                    CharRange([("a", "z")]),
+                ],
+            ),
+            "expected": And(
+                [
+                    And([CharRange([("a", "z")]), CharRange([("0", "9")])], quantifier=(2, 2)),
+                    CharRange([("a", "z")]),
+                ],
+            ),
+        },
         {
             "description": "And with complex repeating subexpression",
             "grammar": And(
@@ -393,11 +421,6 @@ except ImportError:
                 quantifier=(0, 1),
             ),
         },
-        # {
-        #     "description": "And with complex repeating subexpressions, (0, 1) quantifier, and surrounding subexpressions choose best weight",
-        #     "grammar": And(...),
-        #     "expected": And(...),
-        # },
     ],
 )
 def test_and_simplify(test_case):
@@ -455,6 +478,68 @@ def test_complex_simplify():
     )
 
 
+def test_and_simplify_reuses_result_for_equal_grammars():
+    grammar = And([String("a"), And([String("b")], quantifier=(0, 1))])
+    other = And([String("a"), And([String("b")], quantifier=(0, 1))])
+    different = And([String("a"), And([String("c")], quantifier=(0, 1))])
+    assert grammar.structural_hash == other.structural_hash
+    assert grammar.simplify() is other.simplify()
+    assert grammar.simplify() != different.simplify()
+
+
+def test_and_simplify_keeps_result_on_grammar(monkeypatch):
+    grammar = And([String("a"), And([String("")])], quantifier=(0, 1))
+    empty = And([String("")])
+    simplified = grammar.simplify()
+    assert empty.simplify() is None
+
+    def fail(*args, **kwargs):
+        raise AssertionError("simplify_subexprs should not be called again")
+
+    monkeypatch.setattr(And, "simplify_subexprs", staticmethod(fail))
+    assert grammar.simplify() is simplified
+    assert empty.simplify() is None
+
+
+def test_and_simplify_result_cannot_go_stale():
+    char_range = CharRange([("a", "a")])
+    grammar = And([char_range, String("b")])
+    simplified = grammar.simplify()
+    assert simplified == String("ab")
+    with pytest.raises(AttributeError):
+        char_range.char_ranges = [("x", "z")]
+    with pytest.raises(AttributeError):
+        grammar.subexprs = (String("c"),)
+    assert grammar.simplify() is simplified
+
+
+def test_and_simplify_shares_repeated_subtrees():
+    grammar = And(
+        [
+            Or([String("a"), And([String("b"), String("c")])]),
+            String(" "),
+            Or([String("a"), And([String("b"), String("c")])]),
+        ]
+    )
+    simplified = grammar.simplify()
+    assert isinstance(simplified, And)
+    assert simplified.subexprs[0] is simplified.subexprs[2]
+
+
+def test_and_simplify_returns_simplified_grammar_as_is():
+    grammar = And([String("a"), CharRange([("0", "9")])], quantifier=(0, 1))
+    simplified = grammar.simplify()
+    assert simplified == grammar
+    assert simplified is not grammar
+    assert simplified.simplify() is simplified
+
+
+def test_and_simplify_with_unhashable_subexprs():
+    grammar = And([UnhashableGrammar("x"), UnhashableGrammar("x"), String("y")])
+    simplified = grammar.simplify()
+    assert simplified == And([And([UnhashableGrammar("x")], quantifier=(2, 2)), String("y")])
+
+
 def test_complex_simplify2():
     grammar = And(
         [
@@ -609,6 +694,9 @@ def test_and_attrs_dict():
     assert actual == expected
     for i in range(len(actual["subexprs"])):
         assert actual["subexprs"][i] is expected["subexprs"][i]
+    # The list is a shallow copy, so changing it leaves the grammar as-is
+    actual["subexprs"].append(String("c"))
+    assert grammar.subexprs == (string_a, string_b)
 
 
 @pytest.mark.parametrize(
@@ -666,7 +754,7 @@ def test_and_attrs_dict():
     ],
 )
 def test_merge_adjacent_default_and_grammars(test_case):
-    subexprs = [expr.copy() for expr in test_case["subexprs"]]
+    subexprs = list(test_case["subexprs"])
     n = len(subexprs)
     new_n = merge_adjacent_default_and_grammars(subexprs, n)
     assert new_n == len(test_case["expected"]), "\n".join(
@@ -685,3 +773,34 @@ def test_merge_adjacent_default_and_grammars(test_case):
             f"Actual: {fmt_result(subexprs)!s}",
         )
     )
+
+
+def test_merge_adjacent_default_and_grammars_keeps_unmerged_instances():
+    single = And([String("a")])
+    optional = And([String("b")], quantifier=(0, 1))
+    subexprs = [single, optional, And([String("c")]), And([String("d")])]
+    new_n = merge_adjacent_default_and_grammars(subexprs, len(subexprs))
+    assert new_n == 3
+    assert subexprs == [single, optional, And([String("c"), String("d")])]
+    assert (subexprs[0] is single) and (subexprs[1] is optional)
+
+
+@pytest.mark.parametrize(
+    "subexprs, expected",
+    [
+        pytest.param(
+            [String("c"), String("a"), String("b"), String("a"), String("b"), String("a"), String("b"), String("c"), String("c")],
+            [String("c"), And([String("a"), String("b")], quantifier=(3, 3)), String("c"), String("c")],
+            id="Longer repeating chunk removes more subexpressions",
+        ),
+        pytest.param(
+            [String("a"), String("a"), String("b"), String("b"), String("b")],
+            [String("a"), String("a"), And([String("b")], quantifier=(3, 3))],
+            id="More repetitions remove more subexpressions",
+        ),
+    ],
+)
+def test_group_repeating_subexprs_chooses_best_weight(subexprs, expected):
+    actual, n = group_repeating_subexprs(subexprs, len(subexprs))
+    assert actual == expected
+    assert n == len(expected)
@@ -1,15 +1,10 @@
 import pytest
 
-from grammatica.grammar import String
+from grammatica.grammar import CharRange, String
+from grammatica.grammar.group import And, Or
+from grammatica.grammar.group.base import merge_adjacent_default_groups, resimplify_new_subexprs
 
-try:
-    from ..helpers import NoOpGroupGrammar
-except ImportError:
-    import sys
-    from os import path
-
-    sys.path.append(path.dirname(path.dirname(path.dirname(path.abspath(__file__)))))
-    from helpers import NoOpGroupGrammar
+from ..helpers import NoOpGroupGrammar
 
 
 def test_group_grammar_equals_same_instance():
@@ -17,6 +12,23 @@ def test_group_grammar_equals_same_instance():
     assert grammar.equals(grammar)
 
 
+@pytest.mark.parametrize("check_quantifier", [True, False])
+def test_group_grammar_equals_compares_subclass_attrs(check_quantifier):
+    class LabelledAnd(And):
+        __slots__ = ("label",)
+
+        def __init__(self, subexprs, label):
+            super().__init__(subexprs)
+            self.label = label
+
+        def attrs_dict(self):
+            return super().attrs_dict() | {"label": self.label}
+
+    grammar = LabelledAnd([String("a")], "x")
+    assert grammar.equals(LabelledAnd([String("a")], "x"), check_quantifier=check_quantifier)
+    assert not grammar.equals(LabelledAnd([String("a")], "y"), check_quantifier=check_quantifier)
+
+
 @pytest.mark.parametrize(
     "quantifier, expected",
     [
@@ -118,3 +130,101 @@ def test_group_grammar_attrs_dict():
 def test_group_grammar_render_quantifier(quantifier, expected):
     grammar = NoOpGroupGrammar([], quantifier=quantifier)
     assert grammar.render_quantifier() == expected
+
+
+def test_resimplify_new_subexprs():
+    kept = And([String("a"), String("b")])
+    duplicate = String("ab")
+    previous = [kept]
+    actual = resimplify_new_subexprs(
+        [kept, And([String("a"), String("b")]), duplicate, String("")],
+        previous,
+    )
+    assert actual == [kept, String("ab"), String("ab")]
+    assert actual[0] is kept
+    assert actual[2] is duplicate
+
+
+def test_resimplify_new_subexprs_unique():
+    kept = String("a")
+    actual = resimplify_new_subexprs(
+        [kept, And([String("a")]), String("b"), String("b")],
+        [kept],
+        unique=True,
+    )
+    assert actual == [kept, String("b")]
+    assert actual[0] is kept
+
+
+def test_group_grammar_render_is_cached():
+    grammar = And([String("a"), CharRange([("0", "9")])], quantifier=(0, 1))
+    rendered = grammar.render()
+    assert rendered == '("a" [0-9])?'
+    assert grammar.render() is rendered
+    assert grammar.render(wrap=False) == rendered
+
+
+def test_group_grammar_is_read_only():
+    grammar = And([String("a"), String("b")])
+    with pytest.raises(AttributeError):
+        grammar.subexprs = (String("c"),)
+    with pytest.raises(AttributeError):
+        grammar.quantifier = (0, 1)
+    assert grammar.render() == '"a" "b"'
+
+
+def test_group_grammar_is_hashable():
+    subexprs = [String("a"), String("b")]
+    grammar = NoOpGroupGrammar(subexprs)
+    subexprs.append(String("c"))
+    assert grammar.subexprs == (String("a"), String("b"))
+    assert hash(grammar) == hash(NoOpGroupGrammar([String("a"), String("b")]))
+    assert len({grammar, NoOpGroupGrammar([String("a"), String("b")])}) == 1
+
+
+@pytest.mark.parametrize("grammar", [And([String("a")]), Or([String("a")]), String("a"), CharRange([("a", "z")])])
+def test_grammar_has_no_instance_dict(grammar):
+    assert not hasattr(grammar, "__dict__")
+
+
+def test_group_grammar_is_group():
+    assert NoOpGroupGrammar([]).is_group is True
+    assert String("a").is_group is False
+    assert CharRange([("a", "z")]).is_group is False
+
+
+def test_group_grammar_from_validated():
+    subexprs = [String("a"), String("b")]
+    actual = And._from_validated(iter(subexprs))
+    expected = And(subexprs)
+    assert actual == expected
+    assert actual.render() == expected.render()
+    assert actual.needs_wrapped() == expected.needs_wrapped()
+    assert actual.simplify() == expected.simplify()
+
+
+def test_merge_adjacent_default_groups():
+    subexprs = [
+        And([String("a")]),
+        And([String("b")]),
+        Or([String("c")]),
+        And([String("d")], quantifier=(0, 1)),
+        And([String("e")]),
+    ]
+    n = merge_adjacent_default_groups(subexprs, len(subexprs), And)
+    assert subexprs == [
+        And([String("a"), String("b")]),
+        Or([String("c")]),
+        And([String("d")], quantifier=(0, 1)),
+        And([String("e")]),
+    ]
+    assert n == 4
+
+
+def test_merge_adjacent_default_groups_keeps_trailing_subexprs():
+    trailing = String("z")
+    subexprs = [And([String("a")]), And([String("b")]), trailing]
+    n = merge_adjacent_default_groups(subexprs, 2, And)
+    assert n == 1
+    assert subexprs == [And([String("a"), String("b")]), trailing]
+    assert subexprs[1] is trailing
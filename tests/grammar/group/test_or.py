@@ -7,14 +7,7 @@ from grammatica.grammar.group import (
     merge_adjacent_default_or_grammars,
 )
 
-try:
-    from ..helpers import fmt_result
-except ImportError:
-    import sys
-    from os import path
-
-    sys.path.append(path.dirname(path.dirname(path.dirname(path.abspath(__file__)))))
-    from helpers import fmt_result
+from ..helpers import UnhashableGrammar, fmt_result
 
 
 @pytest.mark.parametrize(
@@ -274,6 +267,12 @@ def test_or_needs_wrapped(test_case):
     )
 
 
+def test_or_simplify_with_unhashable_subexprs():
+    grammar = Or([UnhashableGrammar("x"), String("y"), UnhashableGrammar("x")])
+    simplified = grammar.simplify()
+    assert simplified == Or([UnhashableGrammar("x"), String("y")])
+
+
 def test_or_attrs_dict():
     string_a = String("a")
     string_b = String("b")
@@ -339,7 +338,7 @@ def test_or_attrs_dict():
     ],
 )
 def test_merge_adjacent_default_or_grammars(test_case):
-    subexprs = [expr.copy() for expr in test_case["subexprs"]]
+    subexprs = list(test_case["subexprs"])
     n = len(subexprs)
     new_n = merge_adjacent_default_or_grammars(subexprs, n)
     assert new_n == len(test_case["expected"]), "\n".join(
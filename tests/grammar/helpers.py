@@ -37,6 +37,20 @@ class NoOpGrammarAlt(Grammar):
         return {}
 
 
+class UnhashableGrammar(Grammar):
+    def __init__(self, value):
+        self.value = value
+
+    def render(self, **kwargs):
+        return self.value
+
+    def simplify(self):
+        return self
+
+    def attrs_dict(self):
+        return {"value": self.value}
+
+
 class NoOpGroupGrammar(GroupGrammar):
     separator = " "
 
@@ -1,26 +1,16 @@
+from collections import OrderedDict
+
 import pytest
 
 from grammatica.grammar import String
 from grammatica.grammar.base import value_is_simple, value_to_string
 
-try:
-    from .helpers import (
-        NoOpGrammar,
-        NoOpGrammarAlt,
-        NoOpGroupGrammar,
-        fmt_result,
-    )
-except ImportError:
-    import sys
-    from os import path
-
-    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
-    from helpers import (
-        NoOpGrammar,
-        NoOpGrammarAlt,
-        NoOpGroupGrammar,
-        fmt_result,
-    )
+from .helpers import (
+    NoOpGrammar,
+    NoOpGrammarAlt,
+    NoOpGroupGrammar,
+    fmt_result,
+)
 
 
 def test_grammar_render():
@@ -141,6 +131,30 @@ def test_grammar_equals_same_instance():
     assert grammar.equals(grammar)
 
 
+@pytest.mark.parametrize(
+    "grammar, other, expected",
+    [
+        (NoOpGrammar(), NoOpGrammar(), True),
+        (NoOpGrammar(), NoOpGrammarAlt(), False),
+        (NoOpGroupGrammar([String("a")]), NoOpGroupGrammar([String("a")]), True),
+        (NoOpGroupGrammar([String("a")]), NoOpGroupGrammar([String("b")]), False),
+        (
+            NoOpGroupGrammar([String("a")], quantifier=(1, 1)),
+            NoOpGroupGrammar([String("a")], quantifier=(0, 1)),
+            False,
+        ),
+        (
+            NoOpGroupGrammar([String("a"), String("b")]),
+            NoOpGroupGrammar([String("b"), String("a")]),
+            False,
+        ),
+    ],
+)
+def test_grammar_structural_hash(grammar, other, expected):
+    assert (grammar.structural_hash == other.structural_hash) is expected
+    assert grammar.structural_hash == grammar.structural_hash
+
+
 # TODO: More direct way to test would be to have a child of Grammar that defines some attrs
 @pytest.mark.parametrize(
     "grammar, indent, expected",
@@ -231,6 +245,8 @@ def test_value_is_simple(value, expected):
         ({}, None, "{}"),
         ({}, 2, "{}"),
         ({"key": "value"}, None, "{'key': 'value'}"),
+        # Subclass of a supported type
+        (OrderedDict(key="value"), None, "{'key': 'value'}"),
         # Grammar
         (String("a"), None, "String(value='a')"),
         ([String("a"), String("b")], None, "[String(value='a'), String(value='b')]"),
@@ -8,20 +8,25 @@ from grammatica.constants import (
 from grammatica.grammar.char_range import CharRange
 from grammatica.grammar.string import String
 
-try:
-    from .helpers import fmt_result
-except ImportError:
-    import sys
-    from os import path
+from .helpers import fmt_result
 
-    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
-    from helpers import fmt_result
+
+def test_char_range_render_cannot_be_emptied():
+    grammar = CharRange([("a", "z")])
+    with pytest.raises(AttributeError):
+        grammar.char_ranges = []
+    assert grammar.render() == "[a-z]"
 
 
-def test_char_range_render_empty():
+def test_char_range_is_read_only():
     grammar = CharRange([("a", "z")])
-    grammar.char_ranges = []
-    assert grammar.render() is None
+    assert grammar.render() == "[a-z]"
+    with pytest.raises(AttributeError):
+        grammar.char_ranges = [("0", "9")]
+    with pytest.raises(AttributeError):
+        grammar.negate = True
+    assert grammar.char_ranges == (("a", "z"),)
+    assert grammar.render() == "[a-z]"
 
 
 def test_char_range_from_chars():
@@ -99,10 +104,11 @@ def test_char_range_simplify(test_case):
     )
 
 
-def test_char_range_simplify_empty():
+def test_char_range_simplify_cannot_be_emptied():
     grammar = CharRange([("a", "z")])
-    grammar.char_ranges = []
-    assert grammar.simplify() is None
+    with pytest.raises(AttributeError):
+        grammar.char_ranges = []
+    assert grammar.simplify() == CharRange([("a", "z")])
 
 
 @pytest.mark.parametrize(
@@ -164,7 +170,7 @@ def test_char_range_simplify_empty():
             "grammar": CharRange([(char, char)]),
             "expected": f"[\\x{ord(char):02X}]",
         }
-        for char in map(chr, frozenset({0x00, 0x01, 0x02, 0x03, 0x04, 0x7F, 0x80, 0x81, 0xFF}))
+        for char in map(chr, frozenset({0x00, 0x01, 0x02, 0x03, 0x04, 0x7F, 0x80, 0x81, 0xFF, 0x100, 0x6C34}))
     ],
 )
 def test_char_range_render(test_case):
@@ -3,14 +3,7 @@ import pytest
 from grammatica.grammar import DerivationRule, String
 from grammatica.grammar.group import And, Or
 
-try:
-    from .helpers import fmt_result
-except ImportError:
-    import sys
-    from os import path
-
-    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
-    from helpers import fmt_result
+from .helpers import fmt_result
 
 
 def test_derivation_rule_case_insensitive_symbol():
@@ -18,6 +11,17 @@ def test_derivation_rule_case_insensitive_symbol():
     assert rule.symbol == "test-symbol"
 
 
+def test_derivation_rule_is_read_only():
+    rule = DerivationRule("foo", String("value"))
+    grammar = And([rule, String("y")])
+    assert grammar.render() == 'foo "y"'
+    with pytest.raises(AttributeError):
+        rule.symbol = "bar"
+    with pytest.raises(AttributeError):
+        rule.value = String("other")
+    assert grammar.render() == 'foo "y"'
+
+
 def test_derivation_rule_validation_empty_symbol():
     with pytest.raises(ValueError, match="Derivation rule symbol cannot be empty"):
         DerivationRule("", String("value"))
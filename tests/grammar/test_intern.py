@@ -0,0 +1,11 @@
+from grammatica.grammar import String
+from grammatica.grammar._intern import intern_grammar
+from grammatica.grammar.group import And
+
+
+def test_intern_grammar():
+    grammar = intern_grammar(And([String("interned")], quantifier=(2, 2)))
+    other = And([String("interned")], quantifier=(2, 2))
+    different = And([String("interned")], quantifier=(3, 3))
+    assert intern_grammar(other) is grammar
+    assert intern_grammar(different) is different
@@ -8,14 +8,19 @@ from grammatica.constants import (
 from grammatica.grammar import String, merge_adjacent_string_grammars
 from grammatica.grammar.group import And
 
-try:
-    from .helpers import fmt_result
-except ImportError:
-    import sys
-    from os import path
+from .helpers import fmt_result
 
-    sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
-    from helpers import fmt_result
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("abc", "abc"),
+        (5, "5"),
+        (("a", "b"), "('a', 'b')"),
+    ],
+)
+def test_string_value(value, expected):
+    assert String(value).value == expected
 
 
 @pytest.mark.parametrize(
@@ -51,6 +56,16 @@ except ImportError:
             "grammar": String("".join(STRING_LITERAL_ESCAPE_CHARS)),
             "expected": '"{}"'.format("".join(f"\\{c}" for c in STRING_LITERAL_ESCAPE_CHARS)),
         },
+        {
+            "description": "Escape ASCII control characters",
+            "grammar": String("a\x00b\x01\x7f"),
+            "expected": '"a\\x00b\\x01\\x7F"',
+        },
+        {
+            "description": "Escape after a safe prefix",
+            "grammar": String("safe \u6c34\n"),
+            "expected": '"safe \\x6C34\\n"',
+        },
         {
             "description": "Escape non-ASCII characters",
             "grammar": String("".join(chr(i) for i in range(127462, 127462 + 26))),
@@ -70,6 +85,13 @@ def test_string_render(test_case):
     )
 
 
+def test_string_render_is_cached():
+    grammar = String("cached\n")
+    rendered = grammar.render()
+    assert rendered == '"cached\\n"'
+    assert grammar.render() is rendered
+
+
 @pytest.mark.parametrize(
     "test_case",
     [
@@ -104,6 +126,49 @@ def test_string_simplify(test_case):
     )
 
 
+def test_string_simplify_returns_self():
+    grammar = String("unchanged")
+    assert grammar.simplify() is grammar
+
+
+@pytest.mark.parametrize("value", ["short", "long" * 100])
+def test_string_of(value):
+    string = String.of(value)
+    assert string == String(value)
+    assert String.of(value) is string
+    assert string.simplify() is string
+
+
+def test_string_value_is_read_only():
+    string = String("a")
+    assert string.render() == '"a"'
+    with pytest.raises(AttributeError):
+        string.value = "b"
+    assert string.render() == '"a"'
+
+
+def test_string_of_subclass():
+    class CustomString(String):
+        __slots__ = ()
+
+    string = CustomString.of("a")
+    assert type(string) is CustomString
+    assert type(String.of("a")) is String
+
+
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (String("a"), True),  # equal value
+        (String("b"), False),  # different value
+        ("a", False),  # not a grammar
+        (And([String("a")]), False),  # different grammar
+    ],
+)
+def test_string_equals(other, expected):
+    assert String("a").equals(other) is expected
+
+
 def test_string_attrs_dict():
     string = String("test")
     assert string.attrs_dict() == {"value": "test"}
@@ -145,7 +210,7 @@ def test_string_as_string():
     ],
 )
 def test_merge_adjacent_string_grammars(test_case):
-    subexprs = [expr.copy() for expr in test_case["subexprs"]]
+    subexprs = list(test_case["subexprs"])
     n = len(subexprs)
     new_n = merge_adjacent_string_grammars(subexprs, n)
     assert new_n == len(test_case["expected"]), "\n".join(
@@ -164,3 +229,21 @@ def test_merge_adjacent_string_grammars(test_case):
             f"Actual: {fmt_result(subexprs)!s}",
         )
     )
+
+
+def test_merge_adjacent_string_grammars_keeps_trailing_subexprs():
+    subexprs = [String("a"), String("b"), And([String("c")]), String("d"), String("e")]
+    new_n = merge_adjacent_string_grammars(subexprs, 3)
+    assert new_n == 2
+    assert subexprs == [String("ab"), And([String("c")]), String("d"), String("e")]
+
+
+def test_merge_adjacent_string_grammars_skips_subclasses():
+    class CustomString(String):
+        __slots__ = ()
+
+    subexprs = [String("a"), CustomString("b"), String("c"), String("d")]
+    new_n = merge_adjacent_string_grammars(subexprs, len(subexprs))
+    assert new_n == 3
+    assert type(subexprs[1]) is CustomString
+    assert subexprs[2] == String("cd")
@@ -60,7 +60,9 @@ def test_char_to_hex(char, expected):
         (10, "\\x0A"),  # newline
         (126, "\\x7E"),  # '~'
         (255, "\\xFF"),  # max 2-digit hex
+        (256, "\\x100"),  # min 3-digit hex
         (128512, "\\x1F600"),  # emoji (5+ digits)
+        (-1, "\\x-1"),  # negative
     ],
 )
 def test_ord_to_hex(ordinal, expected):